@@ -64,10 +64,6 @@ class GateManager:
         cls.redis.set(key, value, ttl_seconds)
         log.info("Gate closed", gate=gate)
 
-    @classmethod
-    def get_gates(cls) -> dict[str, datetime | None]:
-        return {gate: cls.is_closed(gate) for gate in sorted(Gate)}
-
 
 def gate_check(gate: Gate, func_name: str | None = None) -> bool:
     """Returns True if the provided gate is open"""
@@ -104,8 +100,7 @@ def require_gate_check(gate: Gate) -> Callable:
 @maestro_trigger(MaestroEvent.STARTUP)
 @hass_trigger(HassEvent.STARTUP)
 def reset_gate_selector() -> None:
-    gates_dict = GateManager.get_gates()
-    options = [PLACEHOLDER_OPTION, *list(gates_dict.keys())]
+    options = [PLACEHOLDER_OPTION, *sorted(Gate)]
 
     input_select.gate_selector.set_options(options)
     input_select.gate_selector.select_first()
@@ -3,7 +3,6 @@ from time import sleep
 
 from catt.controllers import setup_cast  # type:ignore[import-untyped]
 from maestro.domains import MediaPlayer
-from maestro.integrations import RedisClient
 from maestro.triggers import cron_trigger
 from maestro.utils import log
 
@@ -32,7 +31,8 @@ def execute_cast(ip_address: str) -> None:
 
 def call_cast_command(display: MediaPlayer, ip_address: str) -> None:
     lock_key = CAST_LOCK_KEY_PREFIX + display.id.entity
-    with RedisClient().lock(lock_key, timeout_seconds=100, exit_if_owned=True):
+    redis = display.state_manager.redis_client
+    with redis.lock(lock_key, timeout_seconds=100, exit_if_owned=True):
         executor = ThreadPoolExecutor(max_workers=1)
         try:
             executor.submit(execute_cast, ip_address).result(timeout=CAST_TIMEOUT_SECONDS)
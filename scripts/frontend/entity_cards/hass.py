@@ -4,7 +4,6 @@ from dataclasses import asdict
 from datetime import timedelta
 
 from maestro.domains import ON
-from maestro.integrations import StateManager
 from maestro.triggers import (
     HassEvent,
     MaestroEvent,
@@ -31,7 +30,7 @@ def initialize_card() -> None:
         title="Hass",
         icon=Icon.RASPBERRY_PI,
     )
-    StateManager().initialize_hass_entity(
+    card.state_manager.initialize_hass_entity(
         entity_id=card.id,
         state="Loading...",
         attributes=asdict(attributes),
@@ -5,7 +5,6 @@ from datetime import timedelta
 
 from maestro.domains import ON, UNAVAILABLE, UNKNOWN
 from maestro.exceptions import AttributeDoesNotExistError
-from maestro.integrations import StateManager
 from maestro.triggers import (
     HassEvent,
     MaestroEvent,
@@ -24,6 +23,8 @@ from scripts.home.door_left_open import EXTERIOR_DOORS
 
 card = maestro.entity_card_3
 
+HVAC_ICON_MAP = {"cool": Icon.SNOWFLAKE, "heat": Icon.FIRE, "off": Icon.HVAC_OFF}
+
 
 @hass_trigger(HassEvent.STARTUP)
 @maestro_trigger(MaestroEvent.STARTUP)
@@ -32,7 +33,7 @@ def initialize_card() -> None:
         title="Home",
         icon=Icon.HOME,
     )
-    StateManager().initialize_hass_entity(
+    card.state_manager.initialize_hass_entity(
         entity_id=card.id,
         state="Loading...",
         attributes=asdict(attributes),
@@ -90,8 +91,7 @@ def set_row_2() -> None:
         if current_temp != setpoint:
             value += f" ({setpoint})"
 
-    icon_map = {"cool": Icon.SNOWFLAKE, "heat": Icon.FIRE, "off": Icon.HVAC_OFF}
-    icon = icon_map.get(climate.thermostat.state, Icon.HELP)
+    icon = HVAC_ICON_MAP.get(climate.thermostat.state, Icon.HELP)
     card.update(row_2_value=value, row_2_icon=icon)
 
 
@@ -2,7 +2,6 @@ from dataclasses import asdict
 from datetime import timedelta
 from time import sleep
 
-from maestro.integrations import StateManager
 from maestro.triggers import (
     HassEvent,
     MaestroEvent,
@@ -29,7 +28,7 @@ def initialize_card() -> None:
         title="Livi",
         icon=Icon.BABY,
     )
-    StateManager().initialize_hass_entity(
+    card.state_manager.initialize_hass_entity(
         entity_id=card.id,
         state="Loading...",
         attributes=asdict(attributes),
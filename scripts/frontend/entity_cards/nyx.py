@@ -2,7 +2,6 @@ from dataclasses import asdict
 from datetime import timedelta
 
 from maestro.domains import UNAVAILABLE, UNKNOWN, Entity
-from maestro.integrations import StateManager
 from maestro.triggers import (
     HassEvent,
     MaestroEvent,
@@ -30,7 +29,7 @@ def initialize_card() -> None:
         title="Nyx",
         icon=Icon.CAR_ELECTRIC_OUTLINE,
     )
-    StateManager().initialize_hass_entity(
+    card.state_manager.initialize_hass_entity(
         entity_id=card.id,
         state="Loading...",
         attributes=asdict(attributes),
@@ -3,7 +3,7 @@ from datetime import datetime
 from time import sleep
 
 from maestro.domains import ON, UNAVAILABLE, UNKNOWN
-from maestro.integrations import StateChangeEvent, StateManager
+from maestro.integrations import StateChangeEvent
 from maestro.triggers import (
     HassEvent,
     MaestroEvent,
@@ -32,7 +32,7 @@ def initialize_card() -> None:
         title="Office",
         icon=Icon.CLOUD,
     )
-    StateManager().initialize_hass_entity(
+    card.state_manager.initialize_hass_entity(
         entity_id=card.id,
         state="Loading...",
         attributes=asdict(attributes),
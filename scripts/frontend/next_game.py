@@ -1,4 +1,3 @@
-from maestro.integrations import StateManager
 from maestro.triggers import (
     HassEvent,
     MaestroEvent,
@@ -40,7 +39,7 @@ def initialize_card() -> None:
         "right_icon_path": "",
         "active": False,
     }
-    StateManager().initialize_hass_entity(
+    card.state_manager.initialize_hass_entity(
         entity_id=card.id,
         state=local_now().isoformat(),
         attributes=attributes,
@@ -1,5 +1,5 @@
 from maestro.domains import HOME, OFF, ON
-from maestro.integrations import EntityId, StateChangeEvent, StateManager
+from maestro.integrations import StateChangeEvent
 from maestro.triggers import (
     HassEvent,
     MaestroEvent,
@@ -18,8 +18,8 @@ from scripts.common.event_type import EventType
 @maestro_trigger(MaestroEvent.STARTUP)
 def initialize_meeting_active_entity() -> None:
     """Create the entity only if it doesn't already exist"""
-    StateManager().initialize_hass_entity(
-        entity_id=EntityId("maestro.meeting_active"),
+    maestro.meeting_active.state_manager.initialize_hass_entity(
+        entity_id=maestro.meeting_active.id,
         state=OFF,
         attributes={},
         restore_cached=True,
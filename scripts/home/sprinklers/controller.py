@@ -27,7 +27,7 @@ class SprinklerController:
         redis_client: RedisClient | None = None,
         scheduler: JobScheduler | None = None,
     ) -> None:
-        self.redis = redis_client or RedisClient()
+        self.redis = redis_client or self.zone_1.state_manager.redis_client
         self.scheduler = scheduler or JobScheduler()
 
     def stop_all(self) -> None: